@@ -8,28 +8,39 @@
 import sys
 import os
 import re
+from functools import lru_cache
 sys.path.append(os.path.dirname(__file__))
 
-from query_fund_holdings import get_fund_holdings, format_holdings_output
+from query_fund_holdings import get_fund_holdings, format_holdings_output, to_json
 
+_CODE_RE = re.compile(r'\d{6}')
+# 一次扫描同时匹配中文条数（前X条/前X大/前X个）和英文条数（top X）
+# 基金代码单独扫描：条数分支会吞掉其中的数字，合并后 "top 123456" 这类输入会丢失基金代码
+_TOP_N_RE = re.compile(r'前(?P<cn>\d+)[条大个]|top\s+(?P<en>\d+)', re.IGNORECASE)
+
+@lru_cache(maxsize=256)
 def extract_fund_code_and_top_n(user_input: str) -> tuple:
-    """从用户输入中提取基金代码和top_n参数"""
+    """从用户输入中提取基金代码和top_n参数（结果按输入缓存，重复查询无需再次解析）"""
     # 查找6位数字（基金代码）
-    code_match = re.search(r'\d{6}', user_input)
+    code_match = _CODE_RE.search(user_input)
     fund_code = code_match.group() if code_match else None
 
-    # 查找top_n参数，支持"前X条"、"top X"、"前X大"等格式
-    top_n = 20  # 默认值
-
-    # 匹配中文格式：前(\d+)条、前(\d+)大、前(\d+)个
-    chinese_match = re.search(r'前(\d+)[条大个]', user_input)
-    if chinese_match:
-        top_n = int(chinese_match.group(1))
+    chinese_top_n = None
+    english_top_n = None
+    for match in _TOP_N_RE.finditer(user_input):
+        if match.group('cn'):
+            if chinese_top_n is None:
+                chinese_top_n = int(match.group('cn'))
+        elif english_top_n is None:
+            english_top_n = int(match.group('en'))
 
-    # 匹配英文格式：top\s+(\d+)
-    english_match = re.search(r'top\s+(\d+)', user_input, re.IGNORECASE)
-    if english_match:
-        top_n = int(english_match.group(1))
+    # 英文格式优先于中文格式，都没有时默认为20
+    if english_top_n is not None:
+        top_n = english_top_n
+    elif chinese_top_n is not None:
+        top_n = chinese_top_n
+    else:
+        top_n = 20
 
     # 限制最大值为20（天天基金网限制）
     top_n = min(top_n, 20)
@@ -37,12 +48,13 @@ def extract_fund_code_and_top_n(user_input: str) -> tuple:
 
     return fund_code, top_n
 
-def query_fund_holdings_main(user_query: str) -> str:
+def query_fund_holdings_main(user_query: str, output_format: str = 'text') -> str:
     """
     主查询函数
 
     Args:
         user_query: 用户的查询字符串
+        output_format: 'text' 输出表格文本，'json' 输出JSON
 
     Returns:
         str: 格式化的查询结果
@@ -51,22 +63,32 @@ def query_fund_holdings_main(user_query: str) -> str:
 
     if fund_code:
         result = get_fund_holdings(fund_code, top_n)
-        return format_holdings_output(result)
+        return format_holdings_output(result, output_format)
     else:
-        return "请提供基金代码（6位数字）以查询持仓信息。例如：'查询基金005827的最新持仓' 或 '查询基金005827前10条重仓股'"
+        message = "请提供基金代码（6位数字）以查询持仓信息。例如：'查询基金005827的最新持仓' 或 '查询基金005827前10条重仓股'"
+        if output_format == 'json':
+            return to_json({'error': message})
+        return message
 
 def main():
     """命令行测试"""
-    if len(sys.argv) < 2:
-        print("用法: python fund_holdings_main.py '<查询语句>'")
+    args = sys.argv[1:]
+    output_format = 'text'
+    if '--json' in args:
+        args.remove('--json')
+        output_format = 'json'
+
+    if not args:
+        print("用法: python fund_holdings_main.py [--json] '<查询语句>'")
         print("示例: ")
         print("  python fund_holdings_main.py '查询基金005827的最新持仓'")
         print("  python fund_holdings_main.py '查询基金005827前10条重仓股'")
         print("  python fund_holdings_main.py '查询基金005827 top 15'")
+        print("  python fund_holdings_main.py --json '查询基金005827前10条重仓股'")
         return
 
-    user_query = ' '.join(sys.argv[1:])
-    result = query_fund_holdings_main(user_query)
+    user_query = ' '.join(args)
+    result = query_fund_holdings_main(user_query, output_format)
     print(result)
 
 if __name__ == "__main__":
@@ -10,16 +10,25 @@ import sys
 
 def package_skill(skill_dir, output_dir="."):
     """打包技能为 .skill 文件"""
+    skill_dir = os.path.normpath(skill_dir)
     skill_name = os.path.basename(skill_dir)
     skill_file = os.path.join(output_dir, f"{skill_name}.skill")
 
-    with zipfile.ZipFile(skill_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(skill_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                # 计算在zip中的相对路径
-                arcname = os.path.relpath(file_path, skill_dir)
-                zipf.write(file_path, arcname)
+    # .skill 需保持 zip 格式；压缩级别1的速度约为默认级别的3倍，压缩率相差不大
+    # compresslevel 参数从 Python 3.7 开始支持，3.6 上使用默认压缩级别
+    zip_options = {'compresslevel': 1} if sys.version_info >= (3, 7) else {}
+    with zipfile.ZipFile(skill_file, 'w', zipfile.ZIP_DEFLATED, **zip_options) as zipf:
+        # 用 os.scandir 遍历目录，文件类型直接取自目录项，无需额外 stat
+        prefix_len = len(skill_dir) + 1
+        stack = [skill_dir]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        # 去掉 skill_dir 前缀即为在zip中的相对路径
+                        zipf.write(entry.path, entry.path[prefix_len:])
 
     print(f"技能已打包到: {skill_file}")
     return skill_file
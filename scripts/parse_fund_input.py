@@ -6,6 +6,37 @@
 """
 
 import re
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+_CLEAN_RE = re.compile(r'[^\w\u4e00-\u9fff]')
+_CODE_RE = re.compile(r'\d{6}')
+# 常见的基金查询关键词
+_QUERY_PATTERNS = [
+    re.compile(r'(.+?)基金'),
+    re.compile(r'(.+?)的持仓'),
+    re.compile(r'(.+?)重仓股'),
+    re.compile(r'(.+?)前十大')
+]
+
+@lru_cache(maxsize=256)
+def _match_fund_code_or_name(user_input: str) -> Tuple[str, str]:
+    """解析用户输入，返回 ('code', 基金代码) 或 ('name', 基金名称)，结果按输入缓存"""
+    # 检查是否包含6位数字（基金代码）
+    code_match = _CODE_RE.search(user_input)
+    if code_match:
+        return 'code', code_match.group()
+
+    # 检查常见的基金查询关键词
+    for pattern in _QUERY_PATTERNS:
+        match = pattern.search(user_input)
+        if match:
+            name = match.group(1).strip()
+            if name and len(name) > 1:
+                return 'name', name
+
+    # 如果没有明确的代码或名称，返回去除空格和特殊字符后的输入作为名称
+    return 'name', _CLEAN_RE.sub('', user_input)
 
 def extract_fund_code_or_name(user_input: str) -> Dict[str, str]:
     """
@@ -17,31 +48,9 @@ def extract_fund_code_or_name(user_input: str) -> Dict[str, str]:
     Returns:
         dict: 包含 'code' 或 'name' 键的字典
     """
-    # 去除空格和特殊字符
-    cleaned_input = re.sub(r'[^\w\u4e00-\u9fff]', '', user_input)
-
-    # 检查是否包含6位数字（基金代码）
-    code_match = re.search(r'\d{6}', user_input)
-    if code_match:
-        return {'code': code_match.group()}
-
-    # 检查常见的基金查询关键词
-    query_patterns = [
-        r'(.+?)基金',
-        r'(.+?)的持仓',
-        r'(.+?)重仓股',
-        r'(.+?)前十大'
-    ]
-
-    for pattern in query_patterns:
-        match = re.search(pattern, user_input)
-        if match:
-            name = match.group(1).strip()
-            if name and len(name) > 1:
-                return {'name': name}
-
-    # 如果没有明确的代码或名称，返回原始输入作为名称
-    return {'name': cleaned_input}
+    # 缓存的是不可变的元组，每次返回新的字典，调用方修改结果不会影响缓存
+    key, value = _match_fund_code_or_name(user_input)
+    return {key: value}
 
 def search_fund_by_name(fund_name: str) -> Optional[str]:
     """
@@ -7,63 +7,153 @@
 
 import requests
 import re
+import os
+import html
 import json
-from typing import Dict, List, Optional
-
-def get_stock_price_change(stock_code: str) -> Optional[str]:
+import time
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # 可选依赖 orjson：C实现的JSON序列化，未安装时使用标准库 json
+    import orjson
+except ImportError:
+    orjson = None
+
+# 复用同一个会话，使天天基金网和腾讯股票API的请求共享连接池（keep-alive）
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=32,
+                       max_retries=Retry(total=3, backoff_factor=0.3))
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+
+# 持仓数据按季度更新，缓存到磁盘6小时；实时行情只在进程内缓存30秒
+# 缓存目录固定在用户目录下，与调用时的工作目录无关
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'fund-holdings')
+_HOLDINGS_TTL = 6 * 3600
+_QUOTE_TTL = 30
+
+# 流式读取持仓页面时的最大字符数，防止异常页面一直读取
+_MAX_PAGE_CHARS = 200000
+
+# 天天基金网持仓页面的解析规则
+_FUND_NAME_RE = re.compile(r"title='([^']+)'[^>]*href='http://fund\.eastmoney\.com/\d+\.html'")
+_DATE_RE = re.compile(r"截止至：<font[^>]*>(\d{4}-\d{2}-\d{2})</font>")
+
+# 持仓表格的行格式，股票名称列已按显示宽度补齐，这里不再指定宽度
+_ROW_FMT = "{:<4} {:<10} {} {:<12.2f} {:<10}".format
+
+# 股票代码首位到市场前缀的映射：6/5/9 开头为沪市（含科创板688），0/3 开头为深市
+_MARKET = {'6': 'sh', '5': 'sh', '9': 'sh', '0': 'sz', '3': 'sz'}
+
+@lru_cache(maxsize=128)
+def _fetch_price_changes(symbols: Tuple[str, ...], time_bucket: int) -> Dict[str, str]:
+    """
+    请求腾讯股票API并解析涨跌幅度，请求失败时抛出异常（失败结果不会被缓存）
+    time_bucket 仅作为缓存键的一部分，使结果在同一时间段内复用
     """
-    获取股票当前涨跌幅度
-    使用腾讯股票API获取实时价格信息
+    url = f"http://qt.gtimg.cn/q={','.join(symbols)}"
+    response = _SESSION.get(url, timeout=5)
+    response.raise_for_status()
+
+    # 解析返回的数据，每只股票一行
+    # 格式: v_s_sh603259="1~药明康德~603259~93.20~-2.00~-2.10~362993~342464~~2780.86~GP-A~";
+    changes = {}
+    # 格式固定，直接按引号和~切分即可，不需要正则
+    for line in response.text.split(';\n'):
+        _, found, rest = line.partition('="')
+        if not found:
+            continue
 
-    Args:
-        stock_code: 股票代码（6位数字）
+        payload, _, _ = rest.partition('"')
+        values = payload.split('~')
+        if len(values) < 6:
+            continue
 
-    Returns:
-        str: 涨跌幅度，如 "+2.35%" 或 "-1.23%"，如果获取失败返回 "--"
-    """
-    try:
-        # 确定股票市场前缀
-        if stock_code.startswith('6'):
-            market_prefix = 'sh'
-        elif stock_code.startswith('0') or stock_code.startswith('3'):
-            market_prefix = 'sz'
+        # 第2个值是股票代码，第5个值是涨跌幅度（百分比）
+        stock_code = values[2]
+        try:
+            change_percent = float(values[5])
+        except ValueError:
+            continue
+        if change_percent >= 0:
+            changes[stock_code] = f"+{change_percent:.2f}%"
         else:
-            return "--"
-
-        symbol = f"s_{market_prefix}{stock_code}"
-        url = f"http://qt.gtimg.cn/q={symbol}"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+            changes[stock_code] = f"{change_percent:.2f}%"
 
-        response = requests.get(url, headers=headers, timeout=5)
-        if response.status_code != 200:
-            return "--"
+    return changes
 
-        # 解析返回的数据
-        # 格式: v_s_sh603259="1~药明康德~603259~93.20~-2.00~-2.10~362993~342464~~2780.86~GP-A~";
-        data = response.text
-        match = re.search(r'"([^"]+)"', data)
-        if not match:
-            return "--"
+def get_stock_price_changes(stock_codes: List[str]) -> Dict[str, str]:
+    """
+    批量获取股票当前涨跌幅度
+    使用腾讯股票API，一次请求返回所有股票的实时价格信息，结果缓存30秒
 
-        values = match.group(1).split('~')
-        if len(values) < 6:
-            return "--"
+    Args:
+        stock_codes: 股票代码列表（6位数字）
 
-        # 第5个值是涨跌幅度（百分比）
-        change_percent_str = values[5]
-        try:
-            change_percent = float(change_percent_str)
-            if change_percent >= 0:
-                return f"+{change_percent:.2f}%"
-            else:
-                return f"{change_percent:.2f}%"
-        except ValueError:
-            return "--"
+    Returns:
+        dict: 股票代码到涨跌幅度的映射，如 {"603259": "-2.10%"}，
+              获取失败的股票不在结果中
+    """
+    symbols = set()
+    for stock_code in stock_codes:
+        market_prefix = _MARKET.get(stock_code[:1])
+        if market_prefix:
+            symbols.add(f"s_{market_prefix}{stock_code}")
+    if not symbols:
+        return {}
 
+    try:
+        return dict(_fetch_price_changes(tuple(sorted(symbols)), int(time.time() // _QUOTE_TTL)))
     except Exception as e:
-        return "--"
+        return {}
+
+def _cache_path(fund_code: str, top_n: int) -> str:
+    """持仓缓存文件路径"""
+    return os.path.join(_CACHE_DIR, f"{fund_code}_{top_n}.json")
+
+def _is_valid_cache_data(data) -> bool:
+    """检查缓存的持仓数据结构是否完整，避免旧格式或损坏的缓存在有效期内一直查询失败"""
+    if not isinstance(data, dict) or not isinstance(data.get('fund_info'), dict):
+        return False
+    if 'report_date' not in data or not isinstance(data.get('holdings'), list) or not data['holdings']:
+        return False
+    return all(
+        isinstance(holding, dict) and {'stock_code', 'stock_name', 'proportion'} <= holding.keys()
+        for holding in data['holdings']
+    )
+
+def _load_cache_entry(fund_code: str, top_n: int) -> Optional[Dict]:
+    """
+    读取持仓缓存条目（包括已过期的，过期条目用于条件请求），不存在或损坏时返回 None
+    条目格式: {'expires': float, 'data': dict, 'etag': str, 'last_modified': str}
+    """
+    try:
+        with open(_cache_path(fund_code, top_n), encoding='utf-8') as f:
+            entry = json.load(f)
+        if not isinstance(entry.get('expires'), (int, float)) or not _is_valid_cache_data(entry.get('data')):
+            return None
+        return entry
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def _save_cache_entry(fund_code: str, top_n: int, entry: Dict) -> None:
+    """写入持仓缓存并刷新过期时间，写入失败时忽略（不影响查询结果）"""
+    path = _cache_path(fund_code, top_n)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(dict(entry, expires=time.time() + _HOLDINGS_TTL), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
 
 def calculate_fund_estimate(holdings: List[Dict]) -> str:
     """
@@ -79,7 +169,6 @@ def calculate_fund_estimate(holdings: List[Dict]) -> str:
     weighted_change = 0.0
 
     for holding in holdings:
-        proportion = holding['proportion']
         change_str = holding['change_percent']
 
         # 跳过无法获取涨跌数据的股票
@@ -87,13 +176,15 @@ def calculate_fund_estimate(holdings: List[Dict]) -> str:
             continue
 
         try:
-            # 移除%符号并转换为浮点数
-            change_value = float(change_str.replace('+', '').replace('%', ''))
-            total_weight += proportion
-            weighted_change += proportion * change_value
+            # 只需去掉末尾的%，float 可以直接解析带正号的字符串
+            change_value = float(change_str.rstrip('%'))
         except (ValueError, TypeError):
             continue
 
+        proportion = holding['proportion']
+        total_weight += proportion
+        weighted_change += proportion * change_value
+
     if total_weight == 0:
         return "无法预测（无有效涨跌数据）"
 
@@ -105,9 +196,156 @@ def calculate_fund_estimate(holdings: List[Dict]) -> str:
     else:
         return f"{estimated_change:.2f}%"
 
+def _strip_tags(fragment: str) -> str:
+    """去掉HTML片段中的标签，只保留文本"""
+    parts = []
+    pos = 0
+    while True:
+        tag_start = fragment.find('<', pos)
+        if tag_start == -1:
+            parts.append(fragment[pos:])
+            break
+        parts.append(fragment[pos:tag_start])
+        tag_end = fragment.find('>', tag_start)
+        if tag_end == -1:
+            break
+        pos = tag_end + 1
+    return ''.join(parts)
+
+def _parse_row(row: str) -> Optional[Tuple[str, str, float, str]]:
+    """
+    解析持仓表格中的一行，按 <td> / </td> 分隔符逐个切出单元格
+    列顺序: 序号、股票代码、股票名称、[最新价、涨跌幅]、相关资讯、占净值比例、持股数、持仓市值
+
+    Returns:
+        tuple: (股票代码, 股票名称, 持仓比例, 持股数)，不是持仓行时返回 None
+    """
+    cells = []
+    cell_start = row.find('<td')
+    while cell_start != -1:
+        content_start = row.find('>', cell_start) + 1
+        content_end = row.find('</td>', content_start)
+        if content_start == 0 or content_end == -1:
+            break
+        cells.append(html.unescape(_strip_tags(row[content_start:content_end])).strip())
+        cell_start = row.find('<td', content_end)
+
+    if len(cells) < 4 or not cells[1].isdigit():
+        return None
+
+    # 占净值比例是名称之后第一个以%结尾的单元格（最新价、涨跌幅由页面脚本填充，这里为空）
+    for i in range(3, len(cells) - 1):
+        if cells[i].endswith('%'):
+            try:
+                return cells[1], cells[2], float(cells[i][:-1]), cells[i + 1]
+            except ValueError:
+                return None
+    return None
+
+def _parse_holdings_page(text: str, fund_code: str, top_n: int) -> Optional[Dict]:
+    """
+    解析天天基金网持仓页面，返回格式同 get_fund_holdings，但 holdings 中没有 'change_percent' 字段
+    页面中没有持仓数据时返回 None
+    """
+    # 提取基金名称
+    fund_name_match = _FUND_NAME_RE.search(text)
+    fund_name = fund_name_match.group(1) if fund_name_match else "未知基金"
+
+    # 提取报告期
+    date_match = _DATE_RE.search(text)
+    report_date = date_match.group(1) if date_match else "未知"
+
+    # 提取重仓股
+    holdings = []
+    stock_codes_seen = set()  # 用于去重的股票代码集合
+    # 页面按报告期从新到旧排列多个表格，只解析第一个（最新一期）
+    start = text.find('<table')
+    end = text.find('</table>', start)
+    table_html = text[start:end] if start != -1 and end != -1 else text
+
+    matches = []
+    for row in table_html.split('</tr>'):
+        parsed = _parse_row(row)
+        if parsed:
+            matches.append(parsed)
+
+    for match in matches[:top_n]:
+        stock_code, stock_name, proportion, market_value = match
+        # 检查股票代码是否已经添加过，避免重复
+        if stock_code not in stock_codes_seen:
+            stock_codes_seen.add(stock_code)
+            holdings.append({
+                'stock_code': stock_code,
+                'stock_name': stock_name,
+                'proportion': proportion
+            })
+
+    if not holdings:
+        return None
+
+    return {
+        'fund_info': {'name': fund_name, 'code': fund_code},
+        'report_date': report_date,
+        'holdings': holdings
+    }
+
+def _fetch_fund_holdings(fund_code: str, top_n: int, cached: Optional[Dict] = None) -> Optional[Dict]:
+    """
+    从天天基金网获取并解析基金持仓（不含涨跌幅度）
+    传入已过期的缓存条目时发起条件请求，服务器返回 304 则直接复用缓存数据
+
+    Returns:
+        dict: 缓存条目 {'data': dict, 'etag': str, 'last_modified': str}，
+              data 格式同 get_fund_holdings，但 holdings 中没有 'change_percent' 字段
+    """
+    url = f"https://fundf10.eastmoney.com/FundArchivesDatas.aspx?type=jjcc&code={fund_code}&topline={top_n}"
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    # 流式读取，最新一期的持仓表格（第一个 </table>）读完后即停止下载
+    # 注意：提前停止时响应体没有读完，连接会被关闭而不是放回连接池，
+    # 所以这个请求用不上 _SESSION 的 keep-alive 复用（腾讯行情请求不受影响）
+    chunks = []
+    size = 0
+    tail = ''
+    with _SESSION.get(url, headers=headers, stream=True, timeout=10) as response:
+        if response.status_code == 304 and cached:
+            # 304 响应也可能带有新的校验信息，有则更新
+            return dict(
+                cached,
+                etag=response.headers.get('ETag') or cached.get('etag'),
+                last_modified=response.headers.get('Last-Modified') or cached.get('last_modified')
+            )
+        if response.status_code != 200:
+            return None
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if response.encoding is None:
+            response.encoding = 'utf-8'
+
+        for chunk in response.iter_content(chunk_size=4096, decode_unicode=True):
+            chunks.append(chunk)
+            size += len(chunk)
+            # </table> 可能被切分在相邻的两个数据块中
+            if '</table>' in tail + chunk or size > _MAX_PAGE_CHARS:
+                break
+            tail = chunk[-7:]
+
+    text = ''.join(chunks)
+
+    data = _parse_holdings_page(text, fund_code, top_n)
+    if data is None:
+        return None
+    return {'data': data, 'etag': etag, 'last_modified': last_modified}
+
 def get_fund_holdings(fund_code: str, top_n: int = 20) -> Optional[Dict]:
     """
     获取基金最新持仓数据
+    持仓部分优先读取磁盘缓存，涨跌幅度每次查询时重新获取
     返回格式: {
         'fund_info': {'name': str, 'code': str},
         'report_date': str,  # 报告期
@@ -123,76 +361,123 @@ def get_fund_holdings(fund_code: str, top_n: int = 20) -> Optional[Dict]:
     try:
         # 天天基金网最多支持查询前20条，所以限制最大值为20
         top_n = min(top_n, 20)
-        url = f"https://fundf10.eastmoney.com/FundArchivesDatas.aspx?type=jjcc&code={fund_code}&topline={top_n}"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
 
-        response = requests.get(url, headers=headers, timeout=10)
-        if response.status_code != 200:
-            return None
-
-        text = response.text
-
-        # 提取基金名称
-        fund_name_match = re.search(r"title='([^']+)'[^>]*href='http://fund\.eastmoney\.com/\d+\.html'", text)
-        fund_name = fund_name_match.group(1) if fund_name_match else "未知基金"
-
-        # 提取报告期
-        date_match = re.search(r"截止至：<font[^>]*>(\d{4}-\d{2}-\d{2})</font>", text)
-        report_date = date_match.group(1) if date_match else "未知"
-
-        # 提取重仓股
-        holdings = []
-        stock_codes_seen = set()  # 用于去重的股票代码集合
-        pattern = r'<td><a[^>]*>(\d+)</a></td>\s*<td[^>]*><a[^>]*>([^<]+)</a></td>.*?<td[^>]*class=\'tor\'>([\d.]+)%</td>.*?<td[^>]*class=\'tor\'>([\d,]+(?:\.\d+)?)</td>'
-
-        matches = re.findall(pattern, text, re.DOTALL)
-
-        for match in matches[:top_n]:
-            stock_code, stock_name, proportion, market_value = match
-            # 检查股票代码是否已经添加过，避免重复
-            if stock_code not in stock_codes_seen:
-                stock_codes_seen.add(stock_code)
-                # 获取涨跌幅度
-                change_percent = get_stock_price_change(stock_code)
-                holdings.append({
-                    'stock_code': stock_code,
-                    'stock_name': stock_name,
-                    'proportion': float(proportion),
-                    'change_percent': change_percent
-                })
-
-        if not holdings:
-            return None
+        # 先查缓存，不存在或已过期时请求网络（过期条目会带上 ETag/Last-Modified）并写入缓存
+        entry = _load_cache_entry(fund_code, top_n)
+        if entry is None or entry['expires'] < time.time():
+            entry = _fetch_fund_holdings(fund_code, top_n, entry)
+            if entry is None:
+                return None
+            _save_cache_entry(fund_code, top_n, entry)
+        data = entry['data']
+
+        # 一次请求批量获取所有股票的涨跌幅度
+        changes = get_stock_price_changes([h['stock_code'] for h in data['holdings']])
+        holdings = [
+            dict(holding, change_percent=changes.get(holding['stock_code'], "--"))
+            for holding in data['holdings']
+        ]
 
         return {
-            'fund_info': {'name': fund_name, 'code': fund_code},
-            'report_date': report_date,
+            'fund_info': data['fund_info'],
+            'report_date': data['report_date'],
             'holdings': holdings
         }
 
     except Exception as e:
         return None
 
-def format_holdings_output(result: Dict) -> str:
-    """格式化输出结果"""
+def _pad_display(text: str, width: int) -> str:
+    """按终端显示宽度右侧补空格，中文等全角字符占2列"""
+    display_width = sum(2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1 for ch in text)
+    return text + ' ' * (width - display_width)
+
+def to_json(data: Dict) -> str:
+    """将结构化数据序列化为JSON字符串（中文不转义，缩进2格）"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+def format_holdings_output(result: Dict, output_format: str = 'text') -> str:
+    """
+    格式化输出结果
+
+    Args:
+        result: get_fund_holdings 的返回值
+        output_format: 'text' 输出表格文本，'json' 输出便于程序解析的JSON
+    """
     if not result:
-        return "未找到基金持仓数据。请检查基金代码是否正确，或该基金可能暂无持仓数据（如货币基金）。"
+        message = "未找到基金持仓数据。请检查基金代码是否正确，或该基金可能暂无持仓数据（如货币基金）。"
+        if output_format == 'json':
+            return to_json({'error': message})
+        return message
 
     # 计算基金估值预测
     estimated_change = calculate_fund_estimate(result['holdings'])
 
-    output = f"基金名称: {result['fund_info']['name']} ({result['fund_info']['code']})\n"
-    output += f"报告期: {result['report_date']}\n"
-    output += f"基金估值预测涨跌幅: {estimated_change}\n"
-    output += "=" * 70 + "\n"
-    output += f"{'排名':<4} {'股票代码':<10} {'股票名称':<12} {'持仓比例(%)':<12} {'涨跌幅度':<10}\n"
-    output += "-" * 70 + "\n"
+    if output_format == 'json':
+        return to_json(dict(result, estimated_change=estimated_change))
+
+    parts = [
+        f"基金名称: {result['fund_info']['name']} ({result['fund_info']['code']})",
+        f"报告期: {result['report_date']}",
+        f"基金估值预测涨跌幅: {estimated_change}",
+        "=" * 70,
+        " ".join([
+            _pad_display('排名', 4), _pad_display('股票代码', 10), _pad_display('股票名称', 12),
+            _pad_display('持仓比例(%)', 12), _pad_display('涨跌幅度', 10)
+        ]),
+        "-" * 70
+    ]
 
     for i, holding in enumerate(result['holdings'], 1):
-        output += f"{i:<4} {holding['stock_code']:<10} {holding['stock_name']:<12} {holding['proportion']:<12.2f} {holding['change_percent']:<10}\n"
-
-    output += f"\n注: 数据来源于天天基金网，显示最新公布的前{len(result['holdings'])}大重仓股。涨跌幅度为当前实时数据。\n"
-    output += "基金估值预测基于重仓股的加权平均涨跌幅计算，仅供参考，实际净值以基金公司公布为准。\n"
-    return output
\ No newline at end of file
+        parts.append(_ROW_FMT(
+            i, holding['stock_code'], _pad_display(holding['stock_name'], 12),
+            holding['proportion'], holding['change_percent']
+        ))
+
+    parts.append("")
+    parts.append(f"注: 数据来源于天天基金网，显示最新公布的前{len(result['holdings'])}大重仓股。涨跌幅度为当前实时数据。")
+    parts.append("基金估值预测基于重仓股的加权平均涨跌幅计算，仅供参考，实际净值以基金公司公布为准。")
+    parts.append("")
+    return "\n".join(parts)
+
+if __name__ == "__main__":
+    # 离线测试页面解析，样例为天天基金网持仓页面的简化结构：
+    # 最新一期的表格带有最新价、涨跌幅两列（由页面脚本填充，接口返回时为空），往期表格没有这两列
+    sample_page = (
+        "<h4><a title='易方达蓝筹精选混合' href='http://fund.eastmoney.com/005827.html'>易方达蓝筹精选混合</a>"
+        "截止至：<font class='px12'>2024-12-31</font></h4>"
+        "<table class='w782 comm tzxq'><thead><tr><th>序号</th><th>股票代码</th><th>股票名称</th>"
+        "<th class='tor'>最新价</th><th class='tor'>涨跌幅</th><th>相关资讯</th>"
+        "<th class='tor'>占净值<br />比例</th><th class='tor'>持股数<br />（万股）</th><th class='tor'>持仓市值<br />（万元）</th></tr></thead><tbody>"
+        "<tr><td>1</td><td><a href='//quote.eastmoney.com/unify/r/1.600519'>600519</a></td>"
+        "<td class='tol'><a href='//quote.eastmoney.com/unify/r/1.600519'>贵州茅台</a></td>"
+        "<td class='tor'><span data-id='dq600519'></span></td><td class='tor'><span data-id='zd600519'></span></td>"
+        "<td class='xglj'><a href='ccbdxq_005827_600519.html'>变动详情</a><a href='//guba.eastmoney.com/list,600519.html'>股吧</a></td>"
+        "<td class='tor'>9.97%</td><td class='tor'>301.20</td><td class='tor'>459,631.20</td></tr>"
+        "<tr><td>2</td><td><a href='//quote.eastmoney.com/unify/r/0.000858'>000858</a></td>"
+        "<td class='tol'><a href='//quote.eastmoney.com/unify/r/0.000858'>五粮液</a></td>"
+        "<td class='tor'><span data-id='dq000858'></span></td><td class='tor'><span data-id='zd000858'></span></td>"
+        "<td class='xglj'><a href='ccbdxq_005827_000858.html'>变动详情</a></td>"
+        "<td class='tor'>9.50%</td><td class='tor'>2,100.00</td><td class='tor'>300,000.00</td></tr>"
+        "</tbody></table>"
+        "<h4>2024年3季度股票投资明细</h4>"
+        "<table class='w782 comm tzxq'><thead><tr><th>序号</th><th>股票代码</th><th>股票名称</th><th>相关资讯</th>"
+        "<th class='tor'>占净值<br />比例</th><th class='tor'>持股数<br />（万股）</th><th class='tor'>持仓市值<br />（万元）</th></tr></thead><tbody>"
+        "<tr><td>1</td><td><a href='//quote.eastmoney.com/unify/r/1.600519'>600519</a></td>"
+        "<td class='tol'><a href='//quote.eastmoney.com/unify/r/1.600519'>贵州茅台</a></td>"
+        "<td class='xglj'><a href='ccbdxq_005827_600519.html'>变动详情</a></td>"
+        "<td class='tor'>9.00%</td><td class='tor'>300.00</td><td class='tor'>400,000.00</td></tr>"
+        "</tbody></table>"
+    )
+
+    # 只解析第一个表格（最新一期），预期两条持仓：600519 9.97、000858 9.50
+    print(f"最新一期: {_parse_holdings_page(sample_page, '005827', 20)}\n")
+
+    # 往期表格没有最新价、涨跌幅列，预期 ('600519', '贵州茅台', 9.0, '300.00')
+    older_table = sample_page[sample_page.rfind('<table'):]
+    for row in older_table.split('</tr>'):
+        parsed = _parse_row(row)
+        if parsed:
+            print(f"往期: {parsed}")